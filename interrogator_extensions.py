@@ -6,10 +6,13 @@ this shows how you can add your own custom analysis tools on top of the interrog
 copy the patterns here and modify to suit your needs.
 """
 
-from jamf_interrogator import JamfInterrogator
+from jamf_interrogator import JamfInterrogator, _materialize, _write_json_atomic
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-import json
+import gzip
+import orjson
 
 
 class CustomInterrogator(JamfInterrogator):
@@ -17,75 +20,119 @@ class CustomInterrogator(JamfInterrogator):
     def find_stale_policies(self, days: int = 90):
         self.logger.info(f"looking for policies not updated in {days} days")
         
-        response = self.tenant.classic.policies.get_all()
+        response = self._get_all_cached('policies', self.tenant.classic.policies)
         
         if not response.ok:
             self.logger.error(f"api returned {response.status_code}")
             print(f"failed to fetch policies: {response.status_code}")
             return
         
-        data = response.json()
-        policies = data.get('policies', [])
+        data = self._parse(response)
+        policies = _materialize(data.get('policies', []))
         
         print(f"\nchecking {len(policies)} policies...")
         
+        details = self._fetch_details_concurrent('policies', self.tenant.classic.policies,
+                                                 [policy['id'] for policy in policies[:5]])
         for policy in policies[:5]:
-            detail_resp = self.tenant.classic.policies.get_by_id(policy['id'])
-            if detail_resp.ok:
-                detail = detail_resp.json()
+            if policy['id'] in details:
                 print(f"  [{policy['id']}] {policy['name']}")
     
     def export_security_settings(self, output_dir: Path):
         self.logger.info("exporting security settings")
         
         output_dir.mkdir(exist_ok=True)
-        
-        profiles_resp = self.tenant.classic.configuration_profiles.get_all()
-        if profiles_resp.ok:
-            profiles_data = profiles_resp.json()
-            profiles_file = output_dir / f"config_profiles_{datetime.now():%Y%m%d}.json"
-            with open(profiles_file, 'w') as f:
-                json.dump(profiles_data, f, indent=2)
-            self.logger.info(f"saved profiles to {profiles_file}")
-            print(f"saved profiles to {profiles_file}")
-        
-        restricted_resp = self.tenant.classic.restricted_software.get_all()
-        if restricted_resp.ok:
-            restricted_data = restricted_resp.json()
-            restricted_file = output_dir / f"restricted_software_{datetime.now():%Y%m%d}.json"
-            with open(restricted_file, 'w') as f:
-                json.dump(restricted_data, f, indent=2)
-            self.logger.info(f"saved restricted software to {restricted_file}")
-            print(f"saved restricted software to {restricted_file}")
+
+        exports = {
+            'profiles': (self.tenant.classic.configuration_profiles,
+                         output_dir / f"config_profiles_{datetime.now():%Y%m%d}.json"),
+            'restricted software': (self.tenant.classic.restricted_software,
+                                    output_dir / f"restricted_software_{datetime.now():%Y%m%d}.json"),
+        }
+
+        def fetch_endpoint(name, ep):
+            resp = self._get_all_cached(name, ep)
+            return resp if resp.ok else None
+
+        # fetches and disk writes run on separate pools, so a slow disk never
+        # holds up the next network call (or the other way round). the bodies
+        # are already valid json and get written through unchanged
+        with ThreadPoolExecutor(max_workers=4) as fetch_pool, \
+                ThreadPoolExecutor(max_workers=2) as write_pool:
+            fetches = {name: fetch_pool.submit(fetch_endpoint, name, ep)
+                       for name, (ep, _) in exports.items()}
+
+            writes = {}
+            for name, future in fetches.items():
+                resp = future.result()
+                if resp is not None:
+                    output_file = exports[name][1]
+                    writes[name] = write_pool.submit(_write_json_atomic,
+                                                     output_file, resp.content)
+
+            for name, future in writes.items():
+                future.result()
+                saved_to = exports[name][1]
+                self.logger.info(f"saved {name} to {saved_to}")
+                print(f"saved {name} to {saved_to}")
     
     def check_policy_scope_overlap(self):
         self.logger.info("checking for scope overlaps")
         
-        response = self.tenant.classic.policies.get_all()
+        response = self._get_all_cached('policies', self.tenant.classic.policies)
         
         if not response.ok:
             print("couldn't fetch policies")
             return
         
-        data = response.json()
-        policies = data.get('policies', [])
+        data = self._parse(response)
+        policies = _materialize(data.get('policies', []))
         
-        policy_scopes = {}
+        details = self._fetch_details_concurrent('policies', self.tenant.classic.policies,
+                                                  [policy['id'] for policy in policies[:10]])
         
+        policy_scopes = {}
         for policy in policies[:10]:
-            detail_resp = self.tenant.classic.policies.get_by_id(policy['id'])
-            if detail_resp.ok:
-                detail = detail_resp.json()
-                scope = detail.get('policy', {}).get('scope', {})
+            detail = details.get(policy['id'])
+            if detail is not None:
                 policy_scopes[policy['id']] = {
                     'name': policy['name'],
-                    'scope': scope
+                    'scope': detail.get('policy', {}).get('scope', {})
                 }
         
         print(f"\nanalysed {len(policy_scopes)} policies")
         self.logger.info(f"analysed {len(policy_scopes)} policies for scope overlap")
     
-    def generate_inventory_report(self, output_file: Path):
+    def analyse_serial_prefixes(self, prefix_length: int = 4):
+        """histogram of serial number prefixes across the fleet.
+        
+        jamf serials encode factory/model info in the leading characters, so
+        this gives a rough hardware breakdown. Counter does the counting in
+        c rather than a python dict-update loop, which matters on big fleets.
+        """
+        self.logger.info("analysing serial number prefixes")
+        
+        response = self._get_all_cached('computers', self.tenant.classic.computers)
+        
+        if not response.ok:
+            self.logger.error(f"api returned {response.status_code}")
+            print(f"failed to fetch computers: {response.status_code}")
+            return
+        
+        data = self._parse(response)
+        computers = _materialize(data.get('computers', []))
+        
+        prefixes = Counter(c['serial_number'][:prefix_length]
+                           for c in computers if c.get('serial_number'))
+        
+        print(f"\nserial prefix breakdown across {len(computers)} computers:")
+        for prefix, count in prefixes.most_common():
+            print(f"  {prefix:<{prefix_length}} {count}")
+        
+        self.logger.info(f"found {len(prefixes)} distinct prefixes")
+    
+    def generate_inventory_report(self, output_file: Path, ndjson: bool = False,
+                                  compress: bool = False):
         self.logger.info("generating inventory report")
         
         report = {
@@ -94,29 +141,52 @@ class CustomInterrogator(JamfInterrogator):
             'details': {}
         }
         
-        computers_resp = self.tenant.classic.computers.get_all()
-        if computers_resp.ok:
-            computers = computers_resp.json().get('computers', [])
-            report['summary']['total_computers'] = len(computers)
-            report['details']['computers'] = computers
-            self.logger.debug(f"added {len(computers)} computers to report")
-        
-        policies_resp = self.tenant.classic.policies.get_all()
-        if policies_resp.ok:
-            policies = policies_resp.json().get('policies', [])
-            report['summary']['total_policies'] = len(policies)
-            report['details']['policies'] = policies
-            self.logger.debug(f"added {len(policies)} policies to report")
-        
-        scripts_resp = self.tenant.classic.scripts.get_all()
-        if scripts_resp.ok:
-            scripts = scripts_resp.json().get('scripts', [])
-            report['summary']['total_scripts'] = len(scripts)
-            report['details']['scripts'] = scripts
-            self.logger.debug(f"added {len(scripts)} scripts to report")
-        
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        endpoints = {
+            'computers': self.tenant.classic.computers,
+            'policies': self.tenant.classic.policies,
+            'scripts': self.tenant.classic.scripts,
+        }
+
+        # fetch all three endpoints concurrently - total time becomes the
+        # slowest single call instead of the sum of all of them
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {name: pool.submit(self._get_all_cached, name, ep)
+                       for name, ep in endpoints.items()}
+            for name, future in futures.items():
+                resp = future.result()
+                if resp.ok:
+                    items = _materialize(self._parse(resp).get(name, []))
+                    report['summary'][f'total_{name}'] = len(items)
+                    report['details'][name] = items
+                    self.logger.debug(f"added {len(items)} {name} to report")
+        
+        def write_report(f):
+            if ndjson:
+                # stream one record per line - never holds more than a single
+                # serialized record in memory, unlike the pretty-printed dump
+                f.write(orjson.dumps({'generated_at': report['generated_at'],
+                                      'summary': report['summary']}) + b'\n')
+                for name, items in report['details'].items():
+                    for item in items:
+                        f.write(orjson.dumps({'endpoint': name, 'record': item}) + b'\n')
+            elif compress:
+                # skip the pretty-printing when gzipping - the indentation is
+                # just bytes for the compressor to chew through
+                f.write(orjson.dumps(report))
+            else:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        
+        if compress and output_file.suffix != '.gz':
+            # level 1 already collapses json's repeated key names several
+            # times over at nearly no cpu cost
+            output_file = output_file.with_suffix(output_file.suffix + '.gz')
+        
+        # written to a temp file and renamed so a crash mid-write doesn't
+        # leave a half-finished report behind
+        tmp = output_file.with_suffix(output_file.suffix + '.tmp')
+        with (gzip.open(tmp, 'wb', compresslevel=1) if compress else open(tmp, 'wb')) as f:
+            write_report(f)
+        tmp.replace(output_file)
         
         self.logger.info(f"report saved to {output_file}")
         print(f"\nreport saved to {output_file}")
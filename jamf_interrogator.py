@@ -4,14 +4,39 @@ jamf interrogator - a practical cli tool for poking around your jamf environment
 """
 
 import argparse
-import json
+import gzip
+import orjson
+import simdjson
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
-import csv
 import logging
+import operator
+import time
 
-from jamfpy import Tenant
+
+def _write_json_atomic(output_file: Path, payload: bytes):
+    """write serialized bytes to a temp file, then rename into place.
+    
+    one write_bytes syscall instead of pretty-printing through a text
+    handle, and the rename means a crash mid-write never leaves a
+    truncated export behind.
+    """
+    tmp = output_file.with_suffix(output_file.suffix + '.tmp')
+    tmp.write_bytes(payload)
+    tmp.replace(output_file)
+
+
+def _materialize(items):
+    """turn a lazy simdjson object/array back into plain python objects"""
+    if hasattr(items, 'as_list'):
+        return items.as_list()
+    if hasattr(items, 'as_dict'):
+        return items.as_dict()
+    return items
 
 
 class JamfInterrogator:
@@ -19,7 +44,30 @@ class JamfInterrogator:
     def __init__(self, config_path: Optional[Path] = None, log_level: int = logging.WARNING):
         self.logger = self._setup_logging(log_level)
         self.config = self._load_config(config_path)
+        self._session = None
         self.tenant = self._init_tenant()
+        self._endpoints = {
+            'policies': self.tenant.classic.policies,
+            'computers': self.tenant.classic.computers,
+            'scripts': self.tenant.classic.scripts,
+            'packages': self.tenant.classic.packages,
+            'groups': self.tenant.classic.computer_groups
+        }
+        # singular spellings used by details/compare, mapped to the
+        # canonical _endpoints key so every cache shares one name per
+        # endpoint regardless of which method fetched it
+        self._endpoints_singular = {
+            'policy': 'policies',
+            'computer': 'computers',
+            'script': 'scripts',
+            'package': 'packages',
+            'group': 'groups'
+        }
+        self._parser = simdjson.Parser()
+        self._get_all_cache = {}
+        self._name_index = {}
+        self._detail_cache = OrderedDict()
+        self._detail_cache_lock = threading.Lock()
     
     def _setup_logging(self, log_level: int) -> logging.Logger:
         logger = logging.getLogger('jamf_interrogator')
@@ -39,8 +87,8 @@ class JamfInterrogator:
     def _load_config(self, config_path: Optional[Path]) -> dict:
         if config_path and config_path.exists():
             self.logger.debug(f"loading config from {config_path}")
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            with open(config_path, 'rb') as f:
+                config = orjson.loads(f.read())
             self.logger.info(f"loaded config for {config.get('fqdn', 'unknown')}")
             return config
         
@@ -48,7 +96,12 @@ class JamfInterrogator:
         print("no config found - you'll need to provide credentials")
         return {}
     
-    def _init_tenant(self) -> Tenant:
+    def _init_tenant(self):
+        # imported here rather than at module level: jamfpy drags in requests
+        # and friends, a couple hundred ms we don't want to pay just for
+        # --help or the init command
+        from jamfpy import Tenant
+        
         try:
             self.logger.info("connecting to jamf...")
             
@@ -66,117 +119,269 @@ class JamfInterrogator:
             )
             
             self.logger.info("connected successfully")
+            self._tune_http_session(tenant)
             return tenant
             
         except Exception as e:
             self.logger.critical(f"connection failed: {e}")
             print(f"couldn't connect to jamf: {e}")
             sys.exit(1)
+
+    def _tune_http_session(self, tenant):
+        """ask for compressed responses and widen the keep-alive pool.
+
+        the classic api returns very repetitive json, so gzip/br cuts the
+        bytes on the wire several-fold, and a bigger connection pool lets
+        the threaded audits reuse connections instead of re-handshaking tls
+        for every worker.
+        """
+        session = getattr(tenant, 'session', None) or getattr(tenant, '_session', None)
+        if session is None or not hasattr(session, 'headers'):
+            self.logger.debug("couldn't find the tenant's http session to tune")
+            return
+        self._session = session
+
+        import importlib.util
+        from requests.adapters import HTTPAdapter
+
+        # only advertise br when a decoder is actually installed - urllib3
+        # passes brotli bytes through undecoded otherwise, and every parse
+        # after that would choke on them
+        encodings = 'gzip, deflate'
+        if importlib.util.find_spec('brotli') or importlib.util.find_spec('brotlicffi'):
+            encodings += ', br'
+
+        def log_encoding_once(response, **kwargs):
+            encoding = response.headers.get('Content-Encoding', 'none')
+            self.logger.debug(f"server responded with Content-Encoding: {encoding}")
+            hooks = session.hooks.get('response')
+            if isinstance(hooks, list) and log_encoding_once in hooks:
+                hooks.remove(log_encoding_once)
+            return response
+
+        session.headers.update({'Accept-Encoding': encodings})
+        session.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=20))
+        session.hooks.setdefault('response', []).append(log_encoding_once)
+        self.logger.debug(f"http session tuned: accepting {encodings}, pool size 20")
+
+    def _get_subset(self, resource: str, subset: str):
+        """fetch a classic api subset projection, e.g. computers/subset/basic.
+        
+        subsets make the server trim every record down to a handful of
+        fields - an order of magnitude less data than full inventory when
+        all we render is id, name and serial. returns None when the raw
+        session isn't available so callers can fall back to get_all.
+        """
+        if self._session is None:
+            return None
+        
+        url = f"{self.config.get('fqdn')}/JSSResource/{resource}/subset/{subset}"
+        self.logger.debug(f"fetching subset projection {url}")
+        try:
+            return self._session.get(url, headers={'Accept': 'application/json'})
+        except Exception as e:
+            self.logger.debug(f"subset fetch failed: {e}")
+            return None
+    
+    def _get_all_cached(self, name, endpoint, ttl: float = 60):
+        """get_all with a short ttl cache.
+        
+        back-to-back commands in the same session (reports, audits, searches)
+        often pull the same list twice - the second call within the ttl is
+        served from memory instead of another round trip.
+        """
+        cached = self._get_all_cache.get(name)
+        if cached and time.monotonic() - cached[0] < ttl:
+            self.logger.debug(f"using cached {name} response")
+            return cached[1]
+        
+        response = endpoint.get_all()
+        if response.ok:
+            self._get_all_cache[name] = (time.monotonic(), response)
+        return response
+    
+    _DETAIL_CACHE_SIZE = 256
+    
+    def _get_detail_cached(self, name, endpoint, item_id):
+        """parsed get_by_id detail, behind a small bounded lru cache.
+        
+        interactive and scripted sessions often re-fetch the same items -
+        comparing candidates against one baseline, re-running an audit -
+        and each hit saves a full round trip. failed fetches return None
+        and are never cached, so they retry next time. safe to call from
+        worker threads.
+        """
+        key = (name, item_id)
+        with self._detail_cache_lock:
+            if key in self._detail_cache:
+                self._detail_cache.move_to_end(key)
+                self.logger.debug(f"using cached {name} {item_id} detail")
+                return self._detail_cache[key]
+        
+        resp = endpoint.get_by_id(item_id)
+        if not resp.ok:
+            self.logger.debug(f"detail fetch for {item_id} returned {resp.status_code}")
+            return None
+        
+        # orjson here on purpose: the shared simdjson parser has a single
+        # buffer and can't be used from worker threads
+        detail = orjson.loads(resp.content)
+        with self._detail_cache_lock:
+            self._detail_cache[key] = detail
+            if len(self._detail_cache) > self._DETAIL_CACHE_SIZE:
+                self._detail_cache.popitem(last=False)
+        return detail
+    
+    def _fetch_details_concurrent(self, name, endpoint, item_ids, max_workers: int = 20):
+        """fetch many get_by_id details in parallel.
+        
+        the classic api has no bulk detail endpoint, so the next best thing
+        is fanning the independent round trips out over the keep-alive pool -
+        N serial fetches become roughly N / workers. returns a dict of
+        {item_id: parsed detail} with failed fetches left out. already-cached
+        details come straight from the lru cache without a request.
+        """
+        def fetch(item_id):
+            return item_id, self._get_detail_cached(name, endpoint, item_id)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return {item_id: detail
+                    for item_id, detail in pool.map(fetch, item_ids)
+                    if detail is not None}
+    
+    def _parse(self, response):
+        """parse a response body on the shared simdjson parser.
+        
+        the parser reuses one internal buffer, so anything returned here is
+        only valid until the next _parse call - materialize results you need
+        to keep before parsing again. not safe to call from worker threads.
+        """
+        return self._parser.parse(response.content)
+    
+    def _index_by_name_lower(self, endpoint, response):
+        """build (name_lower, id, name) tuples for an endpoint's list payload.
+        
+        repeated searches over the same list - one per keyword, say - reuse
+        the index instead of re-parsing and re-lowercasing every name. the
+        index is keyed to the exact response object, so a fresh fetch (ttl
+        expiry) rebuilds it automatically.
+        """
+        cached = self._name_index.get(endpoint)
+        if cached and cached[0] is response:
+            return cached[1]
+        
+        items = self._parse(response).get(endpoint, [])
+        index = []
+        for item in items:
+            name = item.get('name', '')
+            index.append((name.lower(), item['id'], name))
+        
+        self._name_index[endpoint] = (response, index)
+        return index
     
     def list_policies(self, output_format: str = 'table'):
         self.logger.info("fetching policies")
         
-        response = self.tenant.classic.policies.get_all()
+        response = self._get_all_cached('policies', self.tenant.classic.policies)
         
         if not response.ok:
             self.logger.error(f"api returned {response.status_code}")
             print(f"failed to fetch policies: {response.status_code}")
             return
         
-        data = response.json()
-        policies = data.get('policies', [])
+        # lazy parse - the table branch only ever touches id and name, so
+        # the rest of the payload never gets materialized into python objects
+        doc = self._parse(response)
+        policies = doc.get('policies', [])
         self.logger.debug(f"received {len(policies)} policies")
         
         if output_format == 'json':
-            print(json.dumps(policies, indent=2))
+            sys.stdout.buffer.write(orjson.dumps(_materialize(policies), option=orjson.OPT_INDENT_2) + b'\n')
         elif output_format == 'csv':
-            self._output_csv(policies, ['id', 'name'])
+            self._output_csv(_materialize(policies), ['id', 'name'])
         else:
-            print(f"\nfound {len(policies)} policies:")
-            print(f"{'ID':<8} {'Name':<50}")
-            print("-" * 60)
-            for policy in policies:
-                print(f"{policy['id']:<8} {policy['name']:<50}")
-    
-    def list_computers(self, output_format: str = 'table'):
+            # one write for the whole table - per-row print takes the stdout
+            # lock and flushes every line, which dominates on long listings
+            lines = [f"\nfound {len(policies)} policies:",
+                     f"{'ID':<8} {'Name':<50}",
+                     "-" * 60]
+            lines += [f"{policy['id']:<8} {policy['name']:<50}" for policy in policies]
+            sys.stdout.write('\n'.join(lines) + '\n')
+    
+    def list_computers(self, output_format: str = 'table', subset: Optional[str] = None):
         self.logger.info("fetching computers")
         
-        response = self.tenant.classic.computers.get_all()
+        response = self._get_subset('computers', subset) if subset else None
+        if response is not None and not response.ok:
+            # the raw subset call skips the sdk's per-request auth, so a 401
+            # here doesn't mean the normal path is broken too
+            self.logger.debug(f"subset fetch returned {response.status_code}")
+            response = None
+        if response is None:
+            if subset:
+                self.logger.warning("subset fetch unavailable - falling back to full inventory")
+            response = self._get_all_cached('computers', self.tenant.classic.computers)
         
         if not response.ok:
             self.logger.error(f"api returned {response.status_code}")
             print(f"failed to fetch computers: {response.status_code}")
             return
         
-        data = response.json()
-        computers = data.get('computers', [])
+        doc = self._parse(response)
+        computers = doc.get('computers', [])
         self.logger.debug(f"received {len(computers)} computers")
         
         if output_format == 'json':
-            print(json.dumps(computers, indent=2))
+            sys.stdout.buffer.write(orjson.dumps(_materialize(computers), option=orjson.OPT_INDENT_2) + b'\n')
         elif output_format == 'csv':
-            self._output_csv(computers, ['id', 'name', 'serial_number'])
+            self._output_csv(_materialize(computers), ['id', 'name', 'serial_number'])
         else:
-            print(f"\nfound {len(computers)} computers:")
-            print(f"{'ID':<8} {'Name':<40} {'Serial':<15}")
-            print("-" * 65)
-            for comp in computers:
-                serial = comp.get('serial_number', 'N/A')
-                print(f"{comp['id']:<8} {comp['name']:<40} {serial:<15}")
+            lines = [f"\nfound {len(computers)} computers:",
+                     f"{'ID':<8} {'Name':<40} {'Serial':<15}",
+                     "-" * 65]
+            lines += [f"{comp['id']:<8} {comp['name']:<40} {comp.get('serial_number', 'N/A'):<15}"
+                      for comp in computers]
+            sys.stdout.write('\n'.join(lines) + '\n')
     
     def search_by_name(self, query: str, endpoint: str):
         self.logger.info(f"searching {endpoint} for '{query}'")
         
-        endpoint_map = {
-            'policies': self.tenant.classic.policies,
-            'computers': self.tenant.classic.computers,
-            'scripts': self.tenant.classic.scripts,
-            'packages': self.tenant.classic.packages,
-            'groups': self.tenant.classic.computer_groups
-        }
-        
-        if endpoint not in endpoint_map:
+        if endpoint not in self._endpoints:
             self.logger.error(f"unknown endpoint: {endpoint}")
             print(f"unknown endpoint: {endpoint}")
-            print(f"available: {', '.join(endpoint_map.keys())}")
+            print(f"available: {', '.join(self._endpoints.keys())}")
             return
         
-        ep = endpoint_map[endpoint]
-        response = ep.get_all()
+        ep = self._endpoints[endpoint]
+        response = self._get_all_cached(endpoint, ep)
         
         if not response.ok:
             self.logger.error(f"api returned {response.status_code}")
             print(f"failed to fetch data: {response.status_code}")
             return
         
-        data = response.json()
-        items = data.get(endpoint, [])
-        self.logger.debug(f"searching through {len(items)} items")
+        index = self._index_by_name_lower(endpoint, response)
+        self.logger.debug(f"searching through {len(index)} items")
         
-        matches = [item for item in items if query.lower() in item.get('name', '').lower()]
+        query_lower = query.lower()
+        matches = [(item_id, name) for name_lower, item_id, name in index
+                   if query_lower in name_lower]
         
         self.logger.info(f"found {len(matches)} matches")
         print(f"\nfound {len(matches)} matches:")
-        for item in matches:
-            print(f"  [{item['id']}] {item['name']}")
+        for item_id, name in matches:
+            print(f"  [{item_id}] {name}")
     
-    def get_details(self, endpoint: str, item_id: int, save_to: Optional[Path] = None):
+    def get_details(self, endpoint: str, item_id: int, save_to: Optional[Path] = None,
+                    compress: bool = False, pretty: bool = False):
         self.logger.info(f"fetching {endpoint} id {item_id}")
         
-        endpoint_map = {
-            'policy': self.tenant.classic.policies,
-            'computer': self.tenant.classic.computers,
-            'script': self.tenant.classic.scripts,
-            'package': self.tenant.classic.packages,
-            'group': self.tenant.classic.computer_groups
-        }
-        
-        if endpoint not in endpoint_map:
+        if endpoint not in self._endpoints_singular:
             self.logger.error(f"unknown endpoint: {endpoint}")
             print(f"unknown endpoint: {endpoint}")
             return
         
-        ep = endpoint_map[endpoint]
+        ep = self._endpoints[self._endpoints_singular[endpoint]]
         response = ep.get_by_id(item_id)
         
         if not response.ok:
@@ -184,114 +389,120 @@ class JamfInterrogator:
             print(f"failed to fetch details: {response.status_code}")
             return
         
-        data = response.json()
+        # the body is already valid json, so by default it passes through
+        # untouched - only --pretty pays for a parse + re-serialize round trip
+        payload = response.content
+        if pretty:
+            payload = orjson.dumps(_materialize(self._parse(response)),
+                                   option=orjson.OPT_INDENT_2)
         
         if save_to:
+            if compress:
+                # level 1 already collapses json's repeated key names several
+                # times over at nearly no cpu cost
+                save_to = save_to.with_suffix(save_to.suffix + '.gz')
+                payload = gzip.compress(payload, compresslevel=1)
             self.logger.debug(f"saving to {save_to}")
-            with open(save_to, 'w') as f:
-                json.dump(data, f, indent=2)
+            _write_json_atomic(save_to, payload)
             print(f"saved to {save_to}")
         else:
-            print(json.dumps(data, indent=2))
+            sys.stdout.buffer.write(payload + b'\n')
     
     def list_scripts(self, output_format: str = 'table'):
         self.logger.info("fetching scripts")
         
-        response = self.tenant.classic.scripts.get_all()
+        response = self._get_all_cached('scripts', self.tenant.classic.scripts)
         
         if not response.ok:
             self.logger.error(f"api returned {response.status_code}")
             print(f"failed to fetch scripts: {response.status_code}")
             return
         
-        data = response.json()
-        scripts = data.get('scripts', [])
+        doc = self._parse(response)
+        scripts = doc.get('scripts', [])
         self.logger.debug(f"received {len(scripts)} scripts")
         
         if output_format == 'json':
-            print(json.dumps(scripts, indent=2))
+            sys.stdout.buffer.write(orjson.dumps(_materialize(scripts), option=orjson.OPT_INDENT_2) + b'\n')
         elif output_format == 'csv':
-            self._output_csv(scripts, ['id', 'name'])
+            self._output_csv(_materialize(scripts), ['id', 'name'])
         else:
-            print(f"\nfound {len(scripts)} scripts:")
-            print(f"{'ID':<8} {'Name':<50}")
-            print("-" * 60)
-            for script in scripts:
-                print(f"{script['id']:<8} {script['name']:<50}")
+            lines = [f"\nfound {len(scripts)} scripts:",
+                     f"{'ID':<8} {'Name':<50}",
+                     "-" * 60]
+            lines += [f"{script['id']:<8} {script['name']:<50}" for script in scripts]
+            sys.stdout.write('\n'.join(lines) + '\n')
     
     def compare_items(self, endpoint: str, id1: int, id2: int):
         self.logger.info(f"comparing {endpoint} {id1} vs {id2}")
         
-        endpoint_map = {
-            'policy': self.tenant.classic.policies,
-            'script': self.tenant.classic.scripts,
-            'group': self.tenant.classic.computer_groups
-        }
-        
-        if endpoint not in endpoint_map:
+        # compare only makes sense for config-style resources
+        if endpoint not in ('policy', 'script', 'group'):
             self.logger.error(f"unknown endpoint: {endpoint}")
             print(f"unknown endpoint: {endpoint}")
             return
         
-        ep = endpoint_map[endpoint]
+        name = self._endpoints_singular[endpoint]
+        ep = self._endpoints[name]
         
         self.logger.debug(f"fetching {endpoint} {id1}")
-        resp1 = ep.get_by_id(id1)
+        data1 = self._get_detail_cached(name, ep, id1)
         self.logger.debug(f"fetching {endpoint} {id2}")
-        resp2 = ep.get_by_id(id2)
+        data2 = self._get_detail_cached(name, ep, id2)
         
-        if not resp1.ok or not resp2.ok:
+        if data1 is None or data2 is None:
             self.logger.error("failed to fetch one or both items")
             print("failed to fetch one or both items")
             return
         
-        data1 = resp1.json()
-        data2 = resp2.json()
-        
-        all_keys = set(data1.keys()) | set(data2.keys())
-        differences = 0
-        
+        # key views support set ops directly - no need to copy into sets,
+        # and only the differing keys (usually a handful) get sorted
+        only1 = data1.keys() - data2.keys()
+        only2 = data2.keys() - data1.keys()
+        both = data1.keys() & data2.keys()
+
+        diffs = [(key, data1[key], data2[key]) for key in both if data1[key] != data2[key]]
+        diffs += [(key, data1[key], None) for key in only1]
+        diffs += [(key, None, data2[key]) for key in only2]
+        diffs.sort(key=lambda diff: diff[0])
+
         print("\nkey differences:")
-        for key in sorted(all_keys):
-            val1 = data1.get(key)
-            val2 = data2.get(key)
-            
-            if val1 != val2:
-                differences += 1
-                print(f"\n{key}:")
-                print(f"  [{id1}]: {val1}")
-                print(f"  [{id2}]: {val2}")
-        
-        self.logger.info(f"found {differences} differences")
+        for key, val1, val2 in diffs:
+            print(f"\n{key}:")
+            print(f"  [{id1}]: {val1}")
+            print(f"  [{id2}]: {val2}")
+
+        self.logger.info(f"found {len(diffs)} differences")
     
     def audit_empty_groups(self):
         self.logger.info("starting empty groups audit")
         
-        response = self.tenant.classic.computer_groups.get_all()
+        response = self._get_all_cached('groups', self.tenant.classic.computer_groups)
         
         if not response.ok:
             self.logger.error(f"api returned {response.status_code}")
             print(f"failed to fetch groups: {response.status_code}")
             return
         
-        data = response.json()
-        groups = data.get('computer_groups', [])
+        data = self._parse(response)
+        groups = _materialize(data.get('computer_groups', []))
         
         print(f"\nchecking {len(groups)} groups...")
-        empty_groups = []
         
-        for idx, group in enumerate(groups, 1):
-            self.logger.debug(f"checking group {idx}/{len(groups)}: {group['name']}")
+        details = self._fetch_details_concurrent('groups',
+                                                 self.tenant.classic.computer_groups,
+                                                 [group['id'] for group in groups])
+        
+        empty_groups = []
+        for group in groups:
+            detail = details.get(group['id'])
+            if detail is None:
+                continue
             
-            detail_resp = self.tenant.classic.computer_groups.get_by_id(group['id'])
-            if detail_resp.ok:
-                detail = detail_resp.json()
-                group_data = detail.get('computer_group', {})
-                computers = group_data.get('computers', [])
-                
-                if len(computers) == 0:
-                    empty_groups.append(group)
-                    self.logger.debug(f"group {group['id']} is empty")
+            computers = detail.get('computer_group', {}).get('computers', [])
+            if len(computers) == 0:
+                empty_groups.append(group)
+                self.logger.debug(f"group {group['id']} is empty")
         
         self.logger.info(f"found {len(empty_groups)} empty groups")
         print(f"\nfound {len(empty_groups)} empty groups:")
@@ -303,10 +514,21 @@ class JamfInterrogator:
             self.logger.warning("no data to output")
             return
         
+        import csv
+        
         self.logger.debug(f"outputting {len(data)} rows as csv")
-        writer = csv.DictWriter(sys.stdout, fieldnames=fields, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(data)
+        # itemgetter projects each row to a tuple in c, which beats
+        # DictWriter's per-field python lookup loop on big lists; rows are
+        # padded with blanks first so missing keys don't raise
+        getter = operator.itemgetter(*fields)
+        blank = {field: '' for field in fields}
+
+        writer = csv.writer(sys.stdout)
+        writer.writerow(fields)
+        if len(fields) == 1:
+            writer.writerows((row.get(fields[0], ''),) for row in data)
+        else:
+            writer.writerows(getter({**blank, **row}) for row in data)
 
 
 def create_sample_config():
@@ -319,8 +541,8 @@ def create_sample_config():
     
     config_path = Path.home() / '.jamf_interrogator.json'
     
-    with open(config_path, 'w') as f:
-        json.dump(sample, f, indent=2)
+    with open(config_path, 'wb') as f:
+        f.write(orjson.dumps(sample, option=orjson.OPT_INDENT_2))
     
     print(f"created sample config at {config_path}")
     print("edit this file with your jamf credentials")
@@ -360,6 +582,9 @@ examples:
     list_parser = subparsers.add_parser('list', help='list items')
     list_parser.add_argument('endpoint', choices=['policies', 'computers', 'scripts'])
     list_parser.add_argument('--format', choices=['table', 'json', 'csv'], default='table')
+    list_parser.add_argument('--subset',
+                             help='server-side projection for computers (e.g. basic) - '
+                                  'fetches far less data when you only need the summary fields')
     
     search_parser = subparsers.add_parser('search', help='search by name')
     search_parser.add_argument('endpoint', choices=['policies', 'computers', 'scripts', 'packages', 'groups'])
@@ -369,6 +594,10 @@ examples:
     details_parser.add_argument('endpoint', choices=['policy', 'computer', 'script', 'package', 'group'])
     details_parser.add_argument('id', type=int)
     details_parser.add_argument('--save', type=Path, help='save to file')
+    details_parser.add_argument('--compress', action='store_true',
+                                help='gzip the saved file (adds .gz)')
+    details_parser.add_argument('--pretty', action='store_true',
+                                help='indent the json output')
     
     compare_parser = subparsers.add_parser('compare', help='compare two items')
     compare_parser.add_argument('endpoint', choices=['policy', 'script', 'group'])
@@ -404,7 +633,7 @@ examples:
         if args.endpoint == 'policies':
             interrogator.list_policies(args.format)
         elif args.endpoint == 'computers':
-            interrogator.list_computers(args.format)
+            interrogator.list_computers(args.format, args.subset)
         elif args.endpoint == 'scripts':
             interrogator.list_scripts(args.format)
     
@@ -412,7 +641,7 @@ examples:
         interrogator.search_by_name(args.query, args.endpoint)
     
     elif args.command == 'details':
-        interrogator.get_details(args.endpoint, args.id, args.save)
+        interrogator.get_details(args.endpoint, args.id, args.save, args.compress, args.pretty)
     
     elif args.command == 'compare':
         interrogator.compare_items(args.endpoint, args.id1, args.id2)